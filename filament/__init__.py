@@ -11,7 +11,7 @@ from ._exceptions import (
     UnknownClassTagError,
     ValueRequiredError,
 )
-from ._export import CustomJSONExporter, dumps, to_json
+from ._export import CustomJSONExporter, FilamentEncoder, dumps, to_json
 from ._import import CustomJSONImporter, from_json, loads
 from ._importpath import ImportPath
 from ._taggedclass import TaggedClass
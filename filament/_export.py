@@ -1,10 +1,27 @@
 import json
+import sys
 from abc import abstractmethod
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
+from keyword import iskeyword
+from operator import attrgetter, methodcaller
 from types import FunctionType
-from typing import Any, Collection, Mapping, Protocol, Type, TypeVar, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    cast,
+    get_type_hints,
+)
 
 from ._exceptions import ExportTypeError
 from ._taggedclass import TaggedClass
@@ -13,6 +30,250 @@ from ._types import JSON
 T = TypeVar("T", bound=Type)
 
 
+@lru_cache(maxsize=None)
+def _hints(cls: type) -> dict[str, Any]:
+    """Memoized version of `get_type_hints`; annotations are static per class."""
+    return get_type_hints(cls, include_extras=False)
+
+
+@lru_cache(maxsize=None)
+def _hint_items(cls: type) -> tuple[tuple[str, Any], ...]:
+    """The (name, type) pairs of `_hints`, frozen into a tuple once per class."""
+    return tuple(_hints(cls).items())
+
+
+@lru_cache(maxsize=None)
+def _has_custom_exporter(cls: type) -> bool:
+    """Indicates if instances of the given class implement the `CustomJSONExporter`
+    protocol, resolved once per class.
+    """
+    return getattr(cls, "to_json", None) is not None
+
+
+@lru_cache(maxsize=None)
+def _exporter_for(cls: type) -> Optional[Callable[[Any], JSON]]:
+    """Generates a function specialized in exporting instances of the given class.
+
+    The function is built from the type hints of the class, and exports each annotated
+    attribute with a straight sequence of `to_json` calls. Returns `None` if the class
+    has no type hints.
+    """
+    return _generate_exporter(cls, "to_json({})")
+
+
+@lru_cache(maxsize=None)
+def _shallow_exporter_for(cls: type) -> Optional[Callable[[Any], dict[str, Any]]]:
+    """Like `_exporter_for`, but leaves the values of the attributes for
+    `FilamentEncoder` to convert.
+    """
+    return _generate_exporter(cls, "_encode_item({})")
+
+
+# Dict displays with more entries than this are compiled into a series of insertions
+# into an empty dict, rather than built in one go
+_MAX_DICT_DISPLAY_ENTRIES = 15
+
+
+def _generate_exporter(cls: type, template: str) -> Optional[Callable[[Any], Any]]:
+    # Functions have no type hints; and on Python 3.9, get_type_hints() fails on them
+    # instead of returning an empty dict. FunctionType can't be subclassed.
+    if cls is FunctionType:
+        return None
+
+    annotations = _hint_items(cls)
+    if not annotations:
+        return None
+
+    entries = []
+    for field_name, __ in annotations:
+        # Skip internal fields set by the library
+        if field_name.startswith("filament_"):
+            continue
+        if field_name.isidentifier() and not iskeyword(field_name):
+            getter = f"value.{field_name}"
+        else:
+            getter = f"getattr(value, {field_name!r})"
+        entries.append((field_name, template.format(getter)))
+
+    # The tag of a class is fixed once it's declared, so it can be embedded as a literal
+    tag = cls.filament_tag if issubclass(cls, TaggedClass) else None
+
+    namespace: dict[str, Any] = {}
+
+    # Keys are embedded as literals, so every exported dict shares the same string
+    # objects, rather than holding its own copy of each field name
+    if len(entries) + (tag is not None) <= _MAX_DICT_DISPLAY_ENTRIES:
+        items = [f"{key!r}: {expr}" for key, expr in entries]
+        if tag is not None:
+            items.append(f'"class": {tag!r}')
+        source = f"def export(value):\n    return {{{', '.join(items)}}}\n"
+
+    # Past that, it's faster to copy a dict that already has all the keys in place
+    # (and the tag filled in), and assign the values
+    else:
+        shape = dict.fromkeys(key for key, __ in entries)
+        if tag is not None:
+            shape["class"] = tag
+        namespace["_shape"] = shape
+        source = (
+            "def export(value, _shape=_shape):\n"
+            "    record = _shape.copy()\n"
+            + "".join(f"    record[{key!r}] = {expr}\n" for key, expr in entries)
+            + "    return record\n"
+        )
+
+    exec(
+        compile(source, f"<filament exporter for {cls.__qualname__}>", "exec"),
+        globals(),
+        namespace,
+    )
+    return namespace["export"]
+
+
+# Types that are exported unchanged
+_PRIMITIVE_TYPES = frozenset([type(None), str, int, float, bool])
+
+# Indicates if all the given types are primitive types, stopping at the first one
+# that isn't. frozenset.issuperset() does that in C, but only since Python 3.11;
+# earlier versions build a set out of the whole iterable first.
+if sys.version_info >= (3, 11):
+    _all_primitive = _PRIMITIVE_TYPES.issuperset
+else:
+
+    def _all_primitive(types: Iterable[Type]) -> bool:
+        return all(map(_PRIMITIVE_TYPES.__contains__, types))
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Containers that are traversed inline by `_export_container`
+_SEQUENCE_TYPES = frozenset([list, tuple, set, frozenset])
+
+
+def _export_mapping(value: Mapping) -> dict[Any, JSON]:
+    record: dict[Any, JSON] = {}
+    _export_container(value, record)
+    return record
+
+
+def _export_collection(value: Collection) -> list[JSON]:
+    items: list[JSON] = []
+    _export_container(value, items)
+    return items
+
+
+def _export_container(value: Any, shell: Any) -> None:
+    """Fills an empty dict or list with the exported contents of a mapping or a
+    collection, respectively.
+
+    Builtin containers nested within the value are traversed using an explicit stack,
+    rather than recursive calls to `to_json`, and primitives are copied over as they
+    are. Any other value is exported with `to_json`.
+    """
+    # Bind the globals used in the loop as locals, to save a global lookup per item.
+    # This is done on each call, so that to_json can still be patched.
+    export = to_json
+    primitive_types = _PRIMITIVE_TYPES
+    all_primitive = _all_primitive
+    sequence_types = _SEQUENCE_TYPES
+
+    stack = [(value, shell)]
+    push = stack.append
+
+    # Guard against reference cycles, which would otherwise loop forever
+    active: set[int] = set()
+
+    while stack:
+        source, target = stack.pop()
+
+        # Marks the end of a container, once all of its descendants have been exported
+        if target is None:
+            active.remove(source)
+            continue
+
+        source_id = id(source)
+        active.add(source_id)
+        push((source_id, None))
+
+        if type(target) is dict:
+            # Mappings consisting only of primitive keys and values can be copied as a
+            # whole, rather than entry by entry. The checks stop at the first item that
+            # isn't a primitive; values are checked first, since keys are nearly always
+            # strings, and would pass the check in vain for mappings of objects.
+            if all_primitive(map(type, source.values())) and all_primitive(
+                map(type, source)
+            ):
+                target.update(source)
+                continue
+
+            for k, v in source.items():
+                if type(k) not in primitive_types:
+                    k = export(k)
+                item_type = type(v)
+                if item_type in primitive_types:
+                    target[k] = v
+                elif item_type is dict or item_type in sequence_types:
+                    if id(v) in active:
+                        raise ValueError("Circular reference detected")
+                    child: Any = {} if item_type is dict else []
+                    target[k] = child
+                    push((v, child))
+                else:
+                    target[k] = export(v)
+        else:
+            # Same for collections of primitive values
+            if all_primitive(map(type, source)):
+                target.extend(source)
+                continue
+
+            for v in source:
+                item_type = type(v)
+                if item_type in primitive_types:
+                    target.append(v)
+                elif item_type is dict or item_type in sequence_types:
+                    if id(v) in active:
+                        raise ValueError("Circular reference detected")
+                    child = {} if item_type is dict else []
+                    target.append(child)
+                    push((v, child))
+                else:
+                    target.append(export(v))
+
+
+_export_enum = attrgetter("value")
+_export_isoformat = methodcaller("isoformat")
+
+# Exporter for types implementing the `CustomJSONExporter` protocol
+_export_custom = methodcaller("to_json")
+
+
+# Exporters keyed by the exact type of the values they apply to. Checked before any
+# other dispatch logic, so that the bulk of the values in a typical document can be
+# exported with a single dictionary lookup. Starts with the most common types, and
+# learns the rest (enums, subclasses, objects with type hints, types implementing the
+# `CustomJSONExporter` protocol...) as `to_json` comes across them.
+_EXPORTERS: dict[Type, Callable[[Any], JSON]] = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    dict: _export_mapping,
+    list: _export_collection,
+    tuple: _export_collection,
+    set: _export_collection,
+    frozenset: _export_collection,
+    # str() goes straight to the tp_str slot of Decimal, which is faster than calling
+    # the Decimal.__str__ wrapper
+    Decimal: str,
+    date: date.isoformat,
+    time: time.isoformat,
+    datetime: datetime.isoformat,
+}
+
+
 class CustomJSONExporter(Protocol):
     """Protocol that can be implemented by classes wanting to specify the behavior of
     the `to_json` function.
@@ -50,55 +311,174 @@ def to_json(value: Any, *, use_custom_exporter: bool = True) -> JSON:
     Returns:
         The converted value.
     """
-    if value is None:
-        return None
-
-    if use_custom_exporter:
-        custom_exporter = getattr(value, "to_json", None)
-        if custom_exporter is not None:
-            return custom_exporter()
+    value_type: type = type(value)
 
-    if isinstance(value, (str, int, float)):
+    # Primitives are returned as they are, without calling into their exporter
+    if value_type in _PRIMITIVE_TYPES:
         return value
 
-    if isinstance(value, Enum):
-        return value.value
+    exporter = _EXPORTERS.get(value_type)
+    if exporter is not None and (use_custom_exporter or exporter is not _export_custom):
+        return exporter(value)
+
+    has_custom_exporter = _has_custom_exporter(value_type)
+    if has_custom_exporter and use_custom_exporter:
+        _EXPORTERS[value_type] = _export_custom
+        return value.to_json()
 
-    if isinstance(value, Decimal):
-        return str(value)
+    exporter = _resolve_exporter(value_type)
+    if exporter is None:
+        raise ExportTypeError(value)
 
-    if isinstance(value, (time, date, datetime)):
-        return value.isoformat()
+    # Remember the exporter for the next value of the same type; unless the type
+    # implements the exporter protocol, and it was only disabled for this call
+    if not has_custom_exporter:
+        _EXPORTERS[value_type] = exporter
 
-    if isinstance(value, Mapping):
-        record = {}
-        for k, v in value.items():
-            k = to_json(k)
-            record[k] = to_json(v)
+    return exporter(value)
 
-        return record
 
-    if isinstance(value, Collection):
-        return [to_json(v) for v in value]
+def _resolve_exporter(cls: type) -> Optional[Callable[[Any], JSON]]:
+    """Finds the exporter for instances of a class missing from `_EXPORTERS`.
+
+    Returns `None` if filament doesn't know how to export instances of the class.
+    """
+    if issubclass(cls, (str, int, float)):
+        return _identity
+
+    if issubclass(cls, Enum):
+        return _export_enum
+
+    if issubclass(cls, Decimal):
+        return str
+
+    # datetime is a subclass of date
+    if issubclass(cls, (date, time)):
+        return _export_isoformat
+
+    if issubclass(cls, Mapping):
+        return _export_mapping
+
+    if issubclass(cls, Collection):
+        return _export_collection
+
+    # Functions (and any other type without type hints) get no exporter
+    return _exporter_for(cast(type, cls))
+
+
+class FilamentEncoder(json.JSONEncoder):
+    """A JSON encoder that extends `json.JSONEncoder` with the types supported by
+    `to_json`.
+
+    Rather than exporting the whole object graph up front, the encoder converts objects
+    as it comes across them, leaving JSON native types to the (C accelerated) encoder
+    of the `json` module. Objects with type hints, mappings and collections are
+    converted one level at a time, leaving their contents for the encoder to pull.
+
+    The `json` module serializes instances of JSON native types (`str`, `int`, `float`,
+    `list`, `dict`...) on its own, subclasses included. The encoder exports subclasses
+    of those types implementing the `CustomJSONExporter` protocol when it finds them
+    at the top level, or within the objects, mappings and collections it converts;
+    but not when they are found directly within a native `list`, `tuple` or `dict`,
+    which are serialized like their base type. Also, the keys of native dicts must be
+    JSON scalars. `dumps` (without a `cls` parameter) has none of these limitations.
+
+    The function given as the `default` parameter, if any, is called for values that
+    filament doesn't know how to export, instead of raising `ExportTypeError`.
+    """
+
+    def __init__(
+        self, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any
+    ) -> None:
+        # Don't let json.JSONEncoder replace the default() method with the function
+        super().__init__(**kwargs)
+        self._fallback = default
 
-    if not isinstance(value, FunctionType):
-        annotations = get_type_hints(type(value))
-        if annotations:
-            data = {
-                field_name: to_json(getattr(value, field_name))
-                for field_name, __ in annotations.items()
-                if not field_name.startswith("filament_")
-            }
-            if isinstance(value, TaggedClass):
-                data["class"] = value.filament_tag
-            return data
+    def encode(self, o: Any) -> str:
+        return super().encode(_encode_item(o))
 
-    raise ExportTypeError(value)
+    def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
+        return super().iterencode(_encode_item(o), _one_shot)
+
+    def default(self, o: Any) -> Any:
+        cls: type = type(o)
+        try:
+            return _encoder_converter_for(cls)(o)
+        except ExportTypeError as error:
+            if self._fallback is None or error.value is not o:
+                raise
+        return self._fallback(o)
+
+
+@lru_cache(maxsize=None)
+def _encoder_converter_for(cls: type) -> Callable[[Any], Any]:
+    """Obtains the function used by `FilamentEncoder` to convert instances of the given
+    class, resolved once per class.
+
+    This spares the encoder from running `isinstance` checks against ABCs like
+    `Mapping` or `Collection` for every object it comes across.
+    """
+    if not _has_custom_exporter(cls) and not issubclass(
+        cls, (Enum, Decimal, date, time)
+    ):
+        if issubclass(cls, Mapping):
+            return _encode_mapping
+
+        if issubclass(cls, Collection):
+            return _encode_collection
+
+        exporter = _shallow_exporter_for(cast(type, cls))
+        if exporter is not None:
+            return exporter
+
+    return _encode_value
+
+
+# Types that the json module serializes on its own, subclasses included
+_NATIVE_TYPES = (str, int, float, list, tuple, dict)
+
+# Types of the above for which that matches what to_json would do
+_EXACT_NATIVE_TYPES = _PRIMITIVE_TYPES | {list, tuple, dict}
+
+
+def _encode_item(value: Any) -> Any:
+    """Prepares a value found by `FilamentEncoder` in an object, mapping or collection
+    it converts (or at the top level) to be handed back to the json module.
+
+    Subclasses of JSON native types are exported with `to_json`, since the json module
+    would serialize them like their base type, without ever calling `default()`. Any
+    other value is left for the encoder.
+    """
+    if type(value) in _EXACT_NATIVE_TYPES or not isinstance(value, _NATIVE_TYPES):
+        return value
+    return to_json(value)
+
+
+def _encode_mapping(value: Mapping) -> dict[JSON, Any]:
+    return {
+        k if type(k) in _PRIMITIVE_TYPES else to_json(k): _encode_item(v)
+        for k, v in value.items()
+    }
+
+
+def _encode_collection(value: Collection) -> list[Any]:
+    return list(map(_encode_item, value))
+
+
+def _encode_value(value: Any) -> JSON:
+    # Looks up to_json on each call, rather than being bound to it, so that it can
+    # still be patched
+    return to_json(value)
 
 
 def dumps(value: Any, **kwargs) -> str:
     """Serializes the given value to a JSON string.
 
+    The value is exported with `to_json`, and the result is serialized with
+    `json.dumps`. Alternatively, passing `FilamentEncoder` (or a subclass of it) as the
+    `cls` parameter serializes the value as it is being exported, without building
+    the exported value in memory first.
+
     Args:
         value: The value to serialize.
         kwargs: Keyword parameters to forward to `json.dumps`
@@ -106,4 +486,18 @@ def dumps(value: Any, **kwargs) -> str:
     Returns:
         A JSON string representing the value.
     """
+    cls = kwargs.get("cls")
+    if (
+        cls is not None
+        and issubclass(cls, FilamentEncoder)
+        and not kwargs.get("skipkeys")
+    ):
+        try:
+            return json.dumps(value, **kwargs)
+        except TypeError as error:
+            # The json module only accepts JSON scalars as the keys of native dicts;
+            # export the whole value instead (skipkeys would drop those keys)
+            if not str(error).startswith("keys must be"):
+                raise
+
     return json.dumps(to_json(value), **kwargs)
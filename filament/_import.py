@@ -5,8 +5,12 @@ import json
 from abc import abstractmethod
 from datetime import date, datetime, time
 from decimal import Decimal
+from functools import lru_cache
+from itertools import repeat
+from keyword import iskeyword
 from typing import (
     Any,
+    Callable,
     Collection,
     Mapping,
     Optional,
@@ -14,6 +18,9 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
+    get_args,
+    get_origin,
     get_type_hints,
 )
 
@@ -33,6 +40,689 @@ M = TypeVar("M", bound="CustomJSONImporter")
 T = TypeVar("T", bound=Type)
 
 
+@lru_cache(maxsize=None)
+def _hints(cls: type) -> dict[str, Any]:
+    """Memoized version of `get_type_hints`; annotations are static per class."""
+    return get_type_hints(cls, include_extras=False)
+
+
+@lru_cache(maxsize=None)
+def _hints_with_extras(cls: type) -> dict[str, Any]:
+    """Like `_hints`, but keeping `Annotated` metadata."""
+    return get_type_hints(cls, include_extras=True)
+
+
+@lru_cache(maxsize=None)
+def _hint_items(cls: type) -> tuple[tuple[str, Any], ...]:
+    """The (name, type) pairs of the fields of a class, frozen into a tuple once per
+    class.
+
+    Field types only keep their `Annotated` metadata if it includes constraints, since
+    it has no other bearing on the import.
+    """
+    plain_hints = _hints(cls)
+    return tuple(
+        (name, spec if _has_constraints(spec) else plain_hints[name])
+        for name, spec in _hints_with_extras(cls).items()
+    )
+
+
+def _needs_path(spec: Any) -> bool:
+    """Indicates if importing a value of the given type could involve constraints, and
+    therefore requires keeping track of its `ImportPath`.
+
+    Conservative: classes other than scalar and date types are assumed to need it,
+    since their fields, or those of their subclasses, may have constraints.
+    """
+    if spec is _NoneType or spec is Ellipsis:
+        return False
+
+    metadata = getattr(spec, "__metadata__", None)
+    if metadata is not None:
+        return any(
+            isinstance(annotation, Constraint) for annotation in metadata
+        ) or _needs_path(spec.__origin__)
+
+    origin = get_origin(spec)
+    args = get_args(spec)
+    if origin is not None:
+        if origin is not Union and (
+            not isinstance(origin, type)
+            or _kind(origin) not in (_MAPPING, _TUPLE, _COLLECTION)
+        ):
+            return True
+        return any(_needs_path(arg) for arg in args)
+
+    if isinstance(spec, type):
+        return _custom_importer(spec) is None and _kind(spec) not in (
+            _SCALAR,
+            _DATETIME,
+        )
+
+    return True
+
+
+def _has_constraints(spec: Any) -> bool:
+    """Indicates if a type includes constraints, at any level of nesting."""
+    metadata = getattr(spec, "__metadata__", None)
+    if metadata is not None and any(
+        isinstance(annotation, Constraint) for annotation in metadata
+    ):
+        return True
+    return any(_has_constraints(arg) for arg in get_args(spec))
+
+
+@lru_cache(maxsize=None)
+def _importer_for(
+    cls: type,
+) -> Optional[Callable[[dict[str, Any], Optional[ImportPath]], Any]]:
+    """Generates a function specialized in importing instances of the given class.
+
+    The function is built from the type hints of the class, and imports each annotated
+    field with a straight sequence of calls to the importers for their types (as
+    obtained from `_importer`, and bound as default arguments), before passing them all
+    to the constructor of the class. Fields are only given an `ImportPath` if they may
+    carry constraints. Returns `None` if the class has no type hints.
+    """
+    annotations = _hint_items(cls)
+    if not annotations:
+        return None
+
+    namespace: dict[str, Any] = {"_cls": cls, "_FIELD": ImportPath.Type.FIELD}
+    params = ["value", "path", "_cls=_cls", "_FIELD=_FIELD"]
+    body = []
+    kwargs = []
+    unpacked = []
+    tracks_path = False
+
+    for i, (field_name, field_spec) in enumerate(annotations):
+
+        # Skip internal fields set by the library
+        if field_name.startswith("filament_"):
+            continue
+
+        namespace[f"_i{i}"] = _importer(field_spec)
+        params.append(f"_i{i}=_i{i}")
+
+        # Paths are only needed to apply constraints
+        if _needs_path(field_spec):
+            tracks_path = True
+            body.append(f"v = value[{field_name!r}]")
+            body.append(
+                f"f{i} = _i{i}(v, ImportPath("
+                f"v, parent=path, type=_FIELD, key={field_name!r}))"
+            )
+        else:
+            body.append(f"f{i} = _i{i}(value[{field_name!r}], None)")
+        if field_name.isidentifier() and not iskeyword(field_name):
+            kwargs.append(f"{field_name}=f{i}")
+        else:
+            unpacked.append(f"{field_name!r}: f{i}")
+
+    if unpacked:
+        kwargs.append(f"**{{{', '.join(unpacked)}}}")
+    body.append(f"return _cls({', '.join(kwargs)})")
+
+    if tracks_path:
+        body.insert(0, "if path is None:")
+        body.insert(1, "    path = ImportPath(value)")
+
+    source = f"def import_({', '.join(params)}):\n" + "".join(
+        f"    {line}\n" for line in body
+    )
+    exec(
+        compile(source, f"<filament importer for {cls.__qualname__}>", "exec"),
+        globals(),
+        namespace,
+    )
+    return namespace["import_"]
+
+
+_NoneType = type(None)
+_JSON_SCALAR_TYPES = frozenset([str, int, float, bool])
+
+# Kinds of types, as classified by `_kind`
+_SCALAR = 0
+_DATETIME = 1
+_MAPPING = 2
+_TUPLE = 3
+_COLLECTION = 4
+_TAGGED_CLASS = 5
+_OTHER = 6
+
+
+@lru_cache(maxsize=None)
+def _kind(cls: Type) -> int:
+    """Classifies a class by the way `from_json` imports its instances.
+
+    Resolved once per class, so that subclass checks (and particularly those against
+    ABCs like `Mapping` or `Collection`) don't need to be repeated for every value.
+    """
+    if issubclass(cls, (int, float, str, enum.Enum, Decimal)):
+        return _SCALAR
+    if issubclass(cls, (date, time, datetime)):
+        return _DATETIME
+    if issubclass(cls, Mapping):
+        return _MAPPING
+    if issubclass(cls, tuple):
+        return _TUPLE
+    if issubclass(cls, Collection):
+        return _COLLECTION
+    if issubclass(cls, TaggedClass):
+        return _TAGGED_CLASS
+    return _OTHER
+
+
+@lru_cache(maxsize=None)
+def _cached_custom_importer(target_type: Any) -> Optional[Callable[[JSON], Any]]:
+    return getattr(target_type, "from_json", None)
+
+
+def _custom_importer(target_type: Any) -> Optional[Callable[[JSON], Any]]:
+    """Obtains the `CustomJSONImporter.from_json` implementation for the given type, if
+    any, resolved once per type.
+    """
+    try:
+        return _cached_custom_importer(target_type)
+    except TypeError:  # Unhashable Annotated metadata
+        return getattr(target_type, "from_json", None)
+
+
+def _bulk_converter(item_spec: Any) -> Optional[Callable[[JSON], Any]]:
+    """Obtains a function that can import values of the given type on its own, with
+    no extra checks, so that it can be mapped over a whole collection.
+
+    Returns `None` unless the type is a scalar or date type that doesn't implement the
+    `CustomJSONImporter` protocol, and that rejects None values on its own.
+    """
+    # Generic aliases pass for classes on Python 3.9
+    if get_origin(item_spec) is not None or not isinstance(item_spec, type):
+        return None
+    return _cached_bulk_converter(item_spec)
+
+
+@lru_cache(maxsize=None)
+def _cached_bulk_converter(cls: type) -> Optional[Callable[[JSON], Any]]:
+    if _custom_importer(cls) is not None:
+        return None
+    kind = _kind(cls)
+    if kind == _SCALAR:
+        # str() and bool() (and enums with a None value) would accept a None item,
+        # which must be rejected with a ValueRequiredError instead. Mapping str over a
+        # collection isn't any faster than its importer, anyway.
+        if issubclass(cls, (str, bool)):
+            return None
+        if issubclass(cls, enum.Enum):
+            if None in cls._value2member_map_:  # type: ignore
+                return None
+            return _enum_converter(cls)
+        return cls
+    if kind == _DATETIME:
+        return cls.fromisoformat  # type: ignore
+    return None
+
+
+def _enum_converter(cls: Type[enum.Enum]) -> Callable[[JSON], Any]:
+    """Obtains a function that imports members of the given enum from their values.
+
+    Values are looked up directly in the mapping of values to members kept by the
+    enum, bypassing the (comparatively slow) call to the enum class.
+    """
+    members = cls._value2member_map_
+
+    def convert_enum(value: JSON) -> Any:
+        try:
+            return members[value]  # type: ignore
+        except (KeyError, TypeError):
+            pass
+
+        # Let the enum class handle any other value (say, through _missing_), and raise
+        # the proper error
+        return cls(value)
+
+    return convert_enum
+
+
+def _rejects(union_type: Any, value_type: Type) -> bool:
+    """Indicates if `from_json` is certain to fail when importing a value of the given
+    JSON type as the given member of a union.
+
+    Only checks cases that can be decided by looking at the types alone; anything else
+    is assumed to be acceptable, and left for `from_json` to try.
+    """
+    if union_type is _NoneType:
+        return value_type is not _NoneType
+
+    # Annotated types can wrap an Optional, so they could still accept None
+    if value_type is _NoneType:
+        return getattr(union_type, "__metadata__", None) is None
+
+    if union_type in (date, time, datetime):
+        return value_type is not str
+
+    if union_type in (int, float):
+        return value_type in (list, dict)
+
+    # Annotated types and types implementing the `CustomJSONImporter` protocol could
+    # accept anything
+    if (
+        getattr(union_type, "__metadata__", None) is not None
+        or _custom_importer(union_type) is not None
+    ):
+        return False
+
+    # Otherwise, `from_json` raises an `ImportTypeError` when a container or an object
+    # with type hints is given a value of the wrong shape. Spare the cost of building
+    # (and formatting) that exception.
+    origin = get_origin(union_type)
+    args = get_args(union_type)
+    if isinstance(origin, type) and args:
+        kind = _kind(origin)
+        if kind == _MAPPING:
+            return not issubclass(value_type, Mapping)
+        if kind in (_TUPLE, _COLLECTION):
+            return not issubclass(value_type, list)
+        return not issubclass(value_type, dict)
+
+    if isinstance(union_type, type) and _kind(union_type) in (_TAGGED_CLASS, _OTHER):
+        return not issubclass(value_type, dict)
+
+    return False
+
+
+_Importer = Callable[[Any, Optional[ImportPath]], Any]
+
+# Passed as the path for nested values that don't need one, when mapping an importer
+# over a collection
+_NO_PATHS = repeat(None)
+
+_IMPORTERS: dict[Any, list[tuple[Any, _Importer]]] = {}
+_DEFAULT_IMPORTERS: dict[Any, list[tuple[Any, _Importer]]] = {}
+
+
+def _importer(spec: Any, use_custom_importer: bool = True) -> _Importer:
+    """Obtains a function specialized in importing values of the given type, compiling
+    it the first time the type is seen.
+
+    Unions compare equal regardless of the order of their members, so an equal type
+    (say, `list[Union[str, int]]` and `list[Union[int, str]]`) may still need a
+    different importer. Each entry of the cache holds the importers for all the
+    spellings of a type that have been seen so far.
+    """
+    cache = _IMPORTERS if use_custom_importer else _DEFAULT_IMPORTERS
+    try:
+        entries = cache.get(spec)
+    except TypeError:  # Unhashable Annotated metadata
+        return _compile_importer(spec, use_custom_importer)
+
+    if entries is None:
+        entries = cache[spec] = []
+    else:
+        for cached_spec, importer in entries:
+            if _same_spec(cached_spec, spec):
+                return importer
+
+    importer = _compile_importer(spec, use_custom_importer)
+    entries.append((spec, importer))
+    return importer
+
+
+def _same_spec(a: Any, b: Any) -> bool:
+    """Indicates if two equal types are also spelled the same way, down to the order of
+    the members of their unions.
+    """
+    if a is b:
+        return True
+    args_a = get_args(a)
+    args_b = get_args(b)
+    if not args_a:
+        return a == b
+    return (
+        get_origin(a) is get_origin(b)
+        and len(args_a) == len(args_b)
+        and all(map(_same_spec, args_a, args_b))
+    )
+
+
+def _compile_importer(spec: Any, use_custom_importer: bool = True) -> _Importer:
+    """Builds a function specialized in importing values of the given type.
+
+    The returned function takes the value to import and its `ImportPath` (or `None`, if
+    it isn't tracked). Everything that depends on the type alone (its origin and
+    arguments, its kind, whether it implements the `CustomJSONImporter` protocol...)
+    is decided here, once, and the importers for nested types are obtained in advance.
+    Classes are the exception: the importers for their fields are only generated when
+    the first instance is imported, which allows for recursive types.
+    """
+    metadata = getattr(spec, "__metadata__", None)
+    if metadata is not None:
+        return _compile_annotated_importer(
+            spec.__origin__, metadata, use_custom_importer
+        )
+
+    if spec is None or spec is _NoneType:
+        return _import_none
+
+    origin = get_origin(spec)
+    args = get_args(spec)
+    if origin is Union:
+        return _compile_union_importer(spec, args)
+
+    if use_custom_importer:
+        custom_importer = _custom_importer(spec)
+        if custom_importer is not None:
+            return _compile_custom_importer(spec, custom_importer)
+
+    if origin is not None:
+        if not isinstance(origin, type):
+            return _compile_unsupported_importer(spec)
+
+        kind = _kind(origin)
+        if kind == _MAPPING and len(args) == 2:
+            return _compile_mapping_importer(spec, origin, *args)
+
+        if kind == _TUPLE and args:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return _compile_collection_importer(
+                    spec, origin, args[0], ImportPath.Type.TUPLE_ITEM
+                )
+            return _compile_tuple_importer(spec, origin, args)
+
+        if kind == _COLLECTION and args:
+            return _compile_collection_importer(
+                spec, origin, args[0], ImportPath.Type.SEQUENCE_ITEM
+            )
+
+        return _compile_object_importer(spec, origin)
+
+    if not isinstance(spec, type):
+        return _compile_unsupported_importer(spec)
+
+    kind = _kind(spec)
+
+    if kind == _SCALAR and issubclass(spec, enum.Enum):
+        convert_enum = _enum_converter(spec)
+
+        def import_enum(value: JSON, path: Optional[ImportPath]) -> Any:
+            if value is None:
+                raise ValueRequiredError(spec)
+            return convert_enum(value)
+
+        return import_enum
+
+    if kind == _SCALAR:
+
+        def import_scalar(value: JSON, path: Optional[ImportPath]) -> Any:
+            # JSON scalars that already are of the requested type need no conversion
+            if type(value) is spec:
+                return value
+            if value is None:
+                raise ValueRequiredError(spec)
+            return spec(value)
+
+        return import_scalar
+
+    if kind == _DATETIME:
+
+        def import_datetime(value: JSON, path: Optional[ImportPath]) -> Any:
+            if value is None:
+                raise ValueRequiredError(spec)
+            return spec.fromisoformat(value)  # type: ignore
+
+        return import_datetime
+
+    return _compile_object_importer(spec, spec)
+
+
+def _import_none(value: JSON, path: Optional[ImportPath]) -> None:
+    if value is not None:
+        raise NoneRequiredError(value)
+    return None
+
+
+def _compile_unsupported_importer(spec: Any) -> _Importer:
+    def import_unsupported(value: JSON, path: Optional[ImportPath]) -> Any:
+        raise ImportTypeError(value, spec)
+
+    return import_unsupported
+
+
+def _compile_annotated_importer(
+    inner_spec: Any, metadata: tuple[Any, ...], use_custom_importer: bool
+) -> _Importer:
+    inner_importer = _importer(inner_spec, use_custom_importer)
+    constraints = tuple(
+        annotation for annotation in metadata if isinstance(annotation, Constraint)
+    )
+    if not constraints:
+        return inner_importer
+
+    def import_constrained(value: JSON, path: Optional[ImportPath]) -> Any:
+        result = inner_importer(value, path)
+
+        # Values imported without a path get one wrapping the imported value
+        if path is None:
+            path = ImportPath(result)
+        for constraint in constraints:
+            constraint.apply(path)
+        return result
+
+    return import_constrained
+
+
+def _compile_union_importer(spec: Any, members: tuple[Any, ...]) -> _Importer:
+
+    if len(members) == 2 and _NoneType in members:
+        inner_spec = members[0] if members[1] is _NoneType else members[1]
+        inner_importer = _importer(inner_spec)
+
+        # JSON scalars that already are of the requested type need no conversion, and
+        # can skip the call to the inner importer
+        passthrough_type = (
+            inner_spec
+            if isinstance(inner_spec, type) and inner_spec in _JSON_SCALAR_TYPES
+            else None
+        )
+
+        def import_optional(value: JSON, path: Optional[ImportPath]) -> Any:
+            if value is None:
+                return None
+            if type(value) is passthrough_type:
+                return value
+            try:
+                return inner_importer(value, path)
+            except (TypeError, ValueError):
+                pass
+            raise ImportTypeError(value, spec)
+
+        return import_optional
+
+    importers = tuple(_importer(member) for member in members)
+
+    # The importers for the members of the union that could accept a JSON value, keyed
+    # by the type of the value. Narrowing down the members this way avoids paying for
+    # an exception on each member that can't possibly match.
+    candidates_by_type: dict[Type, tuple[_Importer, ...]] = {}
+
+    def import_union(value: JSON, path: Optional[ImportPath]) -> Any:
+        value_type = type(value)
+        try:
+            candidates = candidates_by_type[value_type]
+        except KeyError:
+            candidates = candidates_by_type[value_type] = tuple(
+                importer
+                for member, importer in zip(members, importers)
+                if not _rejects(member, value_type)
+            )
+
+        for importer in candidates:
+            try:
+                return importer(value, path)
+            except (TypeError, ValueError):
+                pass
+        raise ImportTypeError(value, spec)
+
+    return import_union
+
+
+def _compile_custom_importer(
+    spec: Any, custom_importer: Callable[[JSON], Any]
+) -> _Importer:
+    def import_custom(value: JSON, path: Optional[ImportPath]) -> Any:
+        if value is None:
+            raise ValueRequiredError(spec)
+        return custom_importer(value)
+
+    return import_custom
+
+
+def _compile_mapping_importer(
+    spec: Any, cls: Type, key_spec: Any, value_spec: Any
+) -> _Importer:
+    key_importer = _importer(key_spec)
+    value_importer = _importer(value_spec)
+    convert_key = _bulk_converter(key_spec)
+    convert_value = _bulk_converter(value_spec)
+    tracks_path = _needs_path(key_spec) or _needs_path(value_spec)
+    MAPPING_KEY = ImportPath.Type.MAPPING_KEY
+    MAPPING_VALUE = ImportPath.Type.MAPPING_VALUE
+
+    def import_mapping(value: JSON, path: Optional[ImportPath]) -> Any:
+        if value is None:
+            raise ValueRequiredError(spec)
+        if not isinstance(value, Mapping):
+            raise ImportTypeError(value, cls)
+
+        # Convert mappings of simple types in one go
+        if convert_key is not None and convert_value is not None:
+            try:
+                return cls(
+                    zip(
+                        map(convert_key, value.keys()),
+                        map(convert_value, value.values()),
+                    )
+                )
+            except (TypeError, ValueError):
+                # Let the item by item import below raise the proper error
+                pass
+
+        if not tracks_path:
+            return cls(
+                zip(
+                    map(key_importer, value.keys(), _NO_PATHS),
+                    map(value_importer, value.values(), _NO_PATHS),
+                )
+            )
+
+        if path is None:
+            path = ImportPath(value)
+        return cls(
+            (
+                key_importer(k, ImportPath(k, parent=path, type=MAPPING_KEY)),
+                value_importer(
+                    v, ImportPath(v, parent=path, type=MAPPING_VALUE, key=k)
+                ),
+            )
+            for k, v in value.items()
+        )
+
+    return import_mapping
+
+
+def _compile_tuple_importer(
+    spec: Any, cls: Type, item_specs: tuple[Any, ...]
+) -> _Importer:
+    importers = tuple(_importer(item_spec) for item_spec in item_specs)
+    tracks_path = any(_needs_path(item_spec) for item_spec in item_specs)
+    TUPLE_ITEM = ImportPath.Type.TUPLE_ITEM
+
+    def import_tuple(value: JSON, path: Optional[ImportPath]) -> Any:
+        if value is None:
+            raise ValueRequiredError(spec)
+        if not isinstance(value, list):
+            raise ImportTypeError(value, cls)
+
+        if not tracks_path:
+            return cls(map(_call_importer, importers, value))
+
+        if path is None:
+            path = ImportPath(value)
+        return cls(
+            importer(v, ImportPath(v, parent=path, type=TUPLE_ITEM, key=i))
+            for i, (importer, v) in enumerate(zip(importers, value))
+        )
+
+    return import_tuple
+
+
+def _call_importer(importer: _Importer, value: JSON) -> Any:
+    return importer(value, None)
+
+
+def _compile_collection_importer(
+    spec: Any, cls: Type, item_spec: Any, item_type: ImportPath.Type
+) -> _Importer:
+    item_importer = _importer(item_spec)
+    convert = _bulk_converter(item_spec)
+    tracks_path = _needs_path(item_spec)
+
+    def import_collection(value: JSON, path: Optional[ImportPath]) -> Any:
+        if value is None:
+            raise ValueRequiredError(spec)
+        if not isinstance(value, list):
+            raise ImportTypeError(value, cls)
+
+        # Convert collections of simple types in one go
+        if convert is not None:
+            try:
+                return cls(map(convert, value))
+            except (TypeError, ValueError):
+                # Let the item by item import below raise the proper error
+                pass
+
+        if not tracks_path:
+            return cls(map(item_importer, value, _NO_PATHS))
+
+        if path is None:
+            path = ImportPath(value)
+        return cls(
+            item_importer(v, ImportPath(v, parent=path, type=item_type, key=i))
+            for i, v in enumerate(value)
+        )
+
+    return import_collection
+
+
+def _compile_object_importer(spec: Any, cls: type) -> _Importer:
+    # The tags of a class hierarchy are kept in a single dict, created along with its
+    # root class, and updated in place as subclasses are declared; so it can be bound
+    # once, sparing a lookup through the MRO of the class for every value
+    tagged = _kind(cls) == _TAGGED_CLASS
+    tags = cast(Type[TaggedClass], cls).filament_tags if tagged else None
+
+    def import_object(value: JSON, path: Optional[ImportPath]) -> Any:
+        if value is None:
+            raise ValueRequiredError(spec)
+
+        if isinstance(value, dict):
+            target_type = cls
+            if tagged:
+                class_tag = value.get("class")
+                if class_tag:
+                    try:
+                        target_type = tags[class_tag]  # type: ignore
+                    except KeyError:
+                        raise UnknownClassTagError(cls, class_tag)
+
+            importer = _importer_for(target_type)
+            if importer is not None:
+                return importer(value, path)
+
+        raise ImportTypeError(value, cls)
+
+    return import_object
+
+
 class CustomJSONImporter(Protocol):
     """Protocol that can be implemented by classes wanting to specify the behavior of
     the `from_json` function.
@@ -61,169 +751,12 @@ def from_json(
         value: JSON value with the data to process.
         target_type: The type of the object to produce.
     """
-    if target_spec is None:
-        target_type = None
-        metadata = None
-    else:
-        metadata = getattr(target_spec, "__metadata__", None)
-        if metadata is None:
-            target_type = target_spec
-        else:
-            target_type = target_spec.__args__[0]
-
-    def get_path() -> ImportPath:
-        nonlocal path
-        if path is None:
-            path = ImportPath(value)
-        return path
-
-    def get_value():
-        nonlocal target_type
-
-        origin = getattr(target_type, "__origin__", None)
-        if target_type and origin is Union:
-            for union_type in target_type.__args__:
-                try:
-                    return from_json(value, union_type, path=path)
-                except (TypeError, ValueError):
-                    pass
-            raise ImportTypeError(value, target_type)
-        elif target_type in (None, None.__class__):
-            if value is not None:
-                raise NoneRequiredError(value)
-            return None
-        elif value is None:
-            if target_type is not None:
-                raise ValueRequiredError(target_type)
-            return None
-
-        if use_custom_importer:
-            custom_importer = getattr(target_type, "from_json", None)
-            if custom_importer:
-                return custom_importer(value)
-
-        original_type = getattr(target_type, "__origin__", None)
-        type_args = getattr(target_type, "__args__", None)
-
-        if original_type:
-            target_type = original_type
-        else:
-            assert isinstance(target_type, type)
-
-            if issubclass(target_type, (int, float, str, enum.Enum, Decimal)):
-                return target_type(value)  # type: ignore
-
-            if issubclass(target_type, (date, time, datetime)):
-                return target_type.fromisoformat(value)  # type: ignore
-
-        if type_args:
-            assert isinstance(target_type, type)
-
-            if issubclass(target_type, Mapping):
-                if not isinstance(value, Mapping):
-                    raise ImportTypeError(value, target_type)
-                return target_type(
-                    (
-                        from_json(
-                            k,
-                            type_args[0],
-                            path=ImportPath(
-                                k, parent=get_path(), type=ImportPath.Type.MAPPING_KEY
-                            ),
-                        ),
-                        from_json(
-                            v,
-                            type_args[1],
-                            path=ImportPath(
-                                v,
-                                parent=get_path(),
-                                type=ImportPath.Type.MAPPING_VALUE,
-                                key=k,
-                            ),
-                        ),
-                    )
-                    for k, v in value.items()
-                )  # type: ignore
-
-            if issubclass(target_type, tuple):
-                if not isinstance(value, list):
-                    raise ImportTypeError(value, target_type)
-                return target_type(
-                    from_json(
-                        v,
-                        t,
-                        path=ImportPath(
-                            v, parent=get_path(), type=ImportPath.Type.TUPLE_ITEM, key=i
-                        ),
-                    )
-                    for i, (v, t) in enumerate(zip(value, type_args))
-                )  # type: ignore
-
-            if issubclass(target_type, Collection):
-                if not isinstance(value, list):
-                    raise ImportTypeError(value, target_type)
-                return target_type(
-                    from_json(
-                        v,
-                        type_args[0],
-                        path=ImportPath(
-                            v,
-                            parent=get_path(),
-                            type=ImportPath.Type.SEQUENCE_ITEM,
-                            key=i,
-                        ),
-                    )
-                    for i, v in enumerate(value)
-                )  # type: ignore
-
-        if isinstance(value, dict):
-            assert target_type is not None
-            cls = target_type
-            if issubclass(target_type, TaggedClass):
-                class_tag = value.get("class")
-                if class_tag:
-                    try:
-                        cls = target_type.filament_tags[class_tag]  # type: ignore
-                    except KeyError:
-                        raise UnknownClassTagError(target_type, class_tag)
-
-            annotations = get_type_hints(cls, include_extras=True)
-            if annotations:
-                values: dict[str, Any] = {}
-
-                for field_name, field_spec in annotations.items():
-
-                    # Skip internal fields set by the library
-                    if field_name.startswith("filament_"):
-                        continue
-
-                    field_value = value[field_name]
-                    field_value = from_json(
-                        field_value,
-                        field_spec,
-                        path=ImportPath(
-                            field_value,
-                            parent=get_path(),
-                            type=ImportPath.Type.FIELD,
-                            key=field_name,
-                        ),
-                    )
-                    values[field_name] = field_value
-
-                return cls(**values)
-
-        raise ImportTypeError(value, target_type)
-
-    value = get_value()
-
-    # Apply field constraints
-    if metadata is not None:
-        path = get_path()
-        for annotation in metadata:
-            if isinstance(annotation, Constraint):
-                annotation.apply(path)
+    # JSON scalars that already are of the requested type need no conversion. In
+    # particular, this keeps bools from going through the subclass checks for int.
+    if type(value) is target_spec and target_spec in _JSON_SCALAR_TYPES:
+        return value  # type: ignore
 
-    return value  # type: ignore
+    return _importer(target_spec, use_custom_importer)(value, path)
 
 
 def loads(json_str: str, type: Optional[T] = None, **kwargs) -> Optional[T]:
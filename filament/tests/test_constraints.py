@@ -1,9 +1,11 @@
 from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
 from typing import Annotated
 
 import pytest
 
-from filament import Constraint, ConstraintError, ImportPath, from_json
+from filament import Choices, Constraint, ConstraintError, ImportPath, from_json
 
 
 class EvenNumbersConstraint(Constraint):
@@ -56,3 +58,35 @@ def test_does_not_raise_constraint_error_if_constraint_is_satisfied():
         x: Annotated[int, EvenNumbersConstraint]
 
     from_json({"x": 2}, Spam)
+
+
+def test_applies_constraints_on_nested_fields():
+    @dataclass
+    class Spam:
+        x: Annotated[int, EvenNumbersConstraint()]
+
+    @dataclass
+    class Eggs:
+        spams: list[Spam]
+
+    with pytest.raises(EvenNumbersConstraintError) as exc_info:
+        from_json({"spams": [{"x": 2}, {"x": 3}]}, Eggs)
+
+    path = exc_info.value.path
+    assert path.value == 3
+    assert path.key == "x"
+    assert path.parent.type is ImportPath.Type.SEQUENCE_ITEM
+    assert path.parent.key == 1
+    assert path.parent.parent.type is ImportPath.Type.FIELD
+    assert path.parent.parent.key == "spams"
+    assert path.parent.parent.parent.value == {"spams": [{"x": 2}, {"x": 3}]}
+
+
+def test_applies_top_level_constraints_on_the_imported_value():
+    class TestEnum(Enum):
+        A = 1
+
+    assert from_json("1.5", Annotated[Decimal, Choices([Decimal("1.5")])]) == Decimal(
+        "1.5"
+    )
+    assert from_json(1, Annotated[TestEnum, Choices([TestEnum.A])]) is TestEnum.A
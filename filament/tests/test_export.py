@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import json
+import sys
+from dataclasses import dataclass, make_dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -7,7 +9,7 @@ from unittest.mock import patch
 
 import pytest
 
-from filament import ExportTypeError, TaggedClass, to_json
+from filament import ExportTypeError, FilamentEncoder, TaggedClass, dumps, to_json
 
 
 @dataclass(frozen=True)
@@ -46,34 +48,121 @@ def test_exports_str_as_str():
     assert to_json("Hello world") == "Hello world"
 
 
+def test_exports_primitives_unchanged():
+    for value in ("Hello world", 10**20, 1.5):
+        assert to_json(value) is value
+
+
+def test_exports_list_of_primitives_as_list():
+    value = [1, "a", 2.5, True, None]
+    exported = to_json(value)
+    assert exported == value
+    assert exported is not value
+
+
+def test_exports_set_of_primitives_as_list():
+    assert sorted(to_json({3, 1, 2})) == [1, 2, 3]
+
+
+def test_exports_tuple_of_primitives_as_list():
+    assert to_json((1, "a", None)) == [1, "a", None]
+
+
+def test_exports_dict_of_primitives_as_dict():
+    value = {"a": 1, "b": "x", "c": None}
+    exported = to_json(value)
+    assert exported == value
+    assert exported is not value
+
+
 def test_recursively_exports_list_as_list():
     with patch("filament._export.to_json") as MockClass:
         MockClass.side_effect = ToJsonCall
-        assert to_json([1, 2, 3]) == [ToJsonCall(1), ToJsonCall(2), ToJsonCall(3)]
+        assert to_json([Decimal(1), Decimal(2), Decimal(3)]) == [
+            ToJsonCall(Decimal(1)),
+            ToJsonCall(Decimal(2)),
+            ToJsonCall(Decimal(3)),
+        ]
 
 
 def test_recursively_exports_set_as_list():
     with patch("filament._export.to_json") as MockClass:
         MockClass.side_effect = ToJsonCall
-        assert to_json({1, 2, 3}) == [ToJsonCall(1), ToJsonCall(2), ToJsonCall(3)]
+        assert sorted(
+            to_json({Decimal(1), Decimal(2), Decimal(3)}), key=lambda c: c.value
+        ) == [
+            ToJsonCall(Decimal(1)),
+            ToJsonCall(Decimal(2)),
+            ToJsonCall(Decimal(3)),
+        ]
+
+
+def test_recursively_exports_tuple_as_list():
+    with patch("filament._export.to_json") as MockClass:
+        MockClass.side_effect = ToJsonCall
+        assert to_json((Decimal(1), 2, 3)) == [ToJsonCall(Decimal(1)), 2, 3]
 
 
 def test_recursively_exports_dict_as_dict():
     with patch("filament._export.to_json") as MockClass:
         MockClass.side_effect = ToJsonCall
-        assert to_json({"a": 1, "b": 2, "c": 3}) == {
-            ToJsonCall("a"): ToJsonCall(1),
-            ToJsonCall("b"): ToJsonCall(2),
-            ToJsonCall("c"): ToJsonCall(3),
+        assert to_json({"a": Decimal(1), "b": 2, Decimal(3): 3}) == {
+            "a": ToJsonCall(Decimal(1)),
+            "b": 2,
+            ToJsonCall(Decimal(3)): 3,
         }
 
 
+def test_exports_nested_containers_without_recursion():
+    with patch("filament._export.to_json") as MockClass:
+        MockClass.side_effect = ToJsonCall
+        assert to_json({"a": [1, {"b": (Decimal(2), [3])}], "c": {4}}) == {
+            "a": [1, {"b": [ToJsonCall(Decimal(2)), [3]]}],
+            "c": [4],
+        }
+
+
+def test_exports_containers_nested_beyond_the_recursion_limit():
+    value: list = []
+    for __ in range(sys.getrecursionlimit() * 2):
+        value = [value, Decimal(1)]
+
+    exported = to_json(value)
+    depth = 0
+    while exported:
+        assert exported[1] == "1"
+        exported = exported[0]
+        depth += 1
+    assert depth == sys.getrecursionlimit() * 2
+
+
+def test_exports_shared_containers():
+    shared = [1, 2]
+    assert to_json([shared, {"x": shared}]) == [[1, 2], {"x": [1, 2]}]
+
+
+def test_raises_error_when_exporting_circular_containers():
+    value: list = [1]
+    value.append({"a": value})
+
+    with pytest.raises(ValueError):
+        to_json(value)
+
+
 def test_exports_decimal_as_str():
     assert to_json(Decimal("0")) == "0"
     assert to_json(Decimal("1.000")) == "1.000"
     assert to_json(Decimal("-13.75323")) == "-13.75323"
 
 
+def test_exports_equal_decimals_with_their_own_exponent():
+    assert to_json([Decimal("1"), Decimal("1.0"), Decimal("1.00")]) == [
+        "1",
+        "1.0",
+        "1.00",
+    ]
+
+
 def test_exports_enum_as_value_str():
     class TestEnum(Enum):
         A = 1
@@ -85,6 +174,20 @@ def test_exports_enum_as_value_str():
     assert to_json(TestEnum.C) == 3
 
 
+def test_exports_enum_with_custom_json_exporter_protocol():
+    class TestEnum(Enum):
+        A = 1
+
+        def to_json(self):
+            if self is TestEnum.A:
+                return "a"
+            return to_json(self, use_custom_exporter=False)
+
+    assert to_json(TestEnum.A) == "a"
+    assert to_json(TestEnum.A, use_custom_exporter=False) == 1
+    assert to_json(TestEnum.A) == "a"
+
+
 def test_exports_date_as_iso_str():
     d = date.today()
     assert to_json(d) == d.isoformat()
@@ -111,6 +214,20 @@ def test_supports_custom_json_exporter_protocol():
     assert to_json(TestObject("Hello")) == "Hello!"
 
 
+def test_custom_json_exporter_can_call_default_implementation():
+    @dataclass
+    class TestObject:
+        x: int
+
+        def to_json(self):
+            data = to_json(self, use_custom_exporter=False)
+            data["y"] = 2
+            return data
+
+    assert to_json(TestObject(x=1)) == {"x": 1, "y": 2}
+    assert to_json([TestObject(x=1)]) == [{"x": 1, "y": 2}]
+
+
 def test_can_override_export_protocol_on_int_subclasses():
     class TestInt(int):
         def to_json(self):
@@ -173,6 +290,79 @@ def test_exports_dataclass_instance_as_dict():
         assert to_json(obj) == {"x": ToJsonCall(1), "y": ToJsonCall(2)}
 
 
+def test_exports_object_with_slots_as_dict():
+    class TestObject:
+        __slots__ = ("x", "y")
+        x: int
+        y: int
+
+    obj = TestObject()
+    obj.x = 1
+    obj.y = 2
+    assert to_json(obj) == {"x": 1, "y": 2}
+
+
+def test_reuses_field_name_keys_across_exports():
+    class TestObject:
+        __annotations__ = {"x": int, "not-an-identifier": int}
+
+    a = TestObject()
+    b = TestObject()
+    for obj in (a, b):
+        obj.x = 1
+        setattr(obj, "not-an-identifier", 2)
+
+    for key_a, key_b in zip(to_json(a), to_json(b)):
+        assert key_a is key_b
+
+
+def test_exports_objects_with_many_fields():
+    names = [f"f{i}" for i in range(20)]
+    TestObject = make_dataclass("TestObject", [(name, int) for name in names])
+    TestTaggedObject = make_dataclass(
+        "TestTaggedObject", [(name, int) for name in names], bases=(TaggedClass,)
+    )
+
+    data = to_json(TestObject(*range(20)))
+    assert list(data.items()) == list(zip(names, range(20)))
+
+    data = to_json(TestTaggedObject(*range(20)))
+    assert list(data.items()) == [*zip(names, range(20)), ("class", "TestTaggedObject")]
+    assert data is not to_json(TestTaggedObject(*range(20)))
+
+
+def test_exports_class_level_defaults_and_properties():
+    class TestObject:
+        x: int = 1
+        y: int
+
+        @property
+        def y(self):
+            return self.x + 1
+
+    assert to_json(TestObject()) == {"x": 1, "y": 2}
+
+
+def test_exports_subclasses_of_supported_types():
+    class TestInt(int):
+        pass
+
+    class TestDecimal(Decimal):
+        pass
+
+    class TestDate(date):
+        pass
+
+    class TestDict(dict):
+        pass
+
+    for i in range(2):
+        assert to_json(TestInt(3)) == 3
+        assert to_json(TestDecimal("1.5")) == "1.5"
+        assert to_json(TestDate(2021, 1, 2)) == "2021-01-02"
+        assert to_json(TestDict(a=TestInt(1))) == {"a": 1}
+
+
 def test_raises_error_when_exporting_an_unsupported_type():
     class TestObject:
         pass
@@ -188,6 +378,9 @@ def test_raises_error_when_exporting_a_function():
     with pytest.raises(ExportTypeError):
         to_json(foobar)
 
+    with pytest.raises(ExportTypeError):
+        dumps([foobar], cls=FilamentEncoder)
+
 
 def test_raises_error_when_exporting_a_class():
     class TestObject:
@@ -256,3 +449,123 @@ def test_maintains_one_class_tag_mapping_per_class_hierarchy():
 
     assert X.filament_tags is Y.filament_tags
     assert X.filament_tags == {"X": X, "Y": Y}
+
+
+def test_dumps_supported_types():
+    class TestEnum(Enum):
+        A = "a"
+
+    @dataclass
+    class Item(TaggedClass):
+        price: Decimal
+        day: date
+        kind: TestEnum
+
+    @dataclass
+    class Order:
+        items: list[Item]
+        tags: set[str]
+
+    order = Order(
+        items=[Item(price=Decimal("1.50"), day=date(2021, 1, 2), kind=TestEnum.A)],
+        tags={"x"},
+    )
+    assert dumps(order) == (
+        '{"items": [{"price": "1.50", "day": "2021-01-02", "kind": "a", '
+        '"class": "Item"}], "tags": ["x"]}'
+    )
+    assert dumps(order, indent=1) == json.dumps(to_json(order), indent=1)
+    assert dumps(order, cls=FilamentEncoder) == dumps(order)
+    assert dumps(order, cls=FilamentEncoder, indent=1) == dumps(order, indent=1)
+
+
+def test_dumps_exports_non_json_keys():
+    class TestEnum(Enum):
+        A = "a"
+
+    value = {
+        "x": [{TestEnum.A: 1, Decimal("1.5"): 2, date(2021, 1, 2): 3}],
+        "y": Decimal(1),
+    }
+    expected = json.dumps(to_json(value))
+    assert expected == ('{"x": [{"a": 1, "1.5": 2, "2021-01-02": 3}], "y": "1"}')
+    assert dumps(value) == expected
+    assert dumps(value, skipkeys=True) == expected
+    assert dumps(value, cls=FilamentEncoder) == expected
+    assert dumps(value, cls=FilamentEncoder, skipkeys=True) == expected
+
+
+def test_dumps_exports_values_before_using_other_encoders():
+    @dataclass
+    class TestObject:
+        x: Decimal
+
+    value = TestObject(Decimal("1.10"))
+    assert dumps(value, cls=json.JSONEncoder) == '{"x": "1.10"}'
+    assert dumps(value, default=str) == '{"x": "1.10"}'
+    assert dumps(value, cls=FilamentEncoder, default=str) == '{"x": "1.10"}'
+
+
+def test_encoder_calls_default_for_unsupported_types():
+    class TestObject:
+        pass
+
+    assert dumps([TestObject()], cls=FilamentEncoder, default=lambda o: "?") == '["?"]'
+
+
+def test_encoder_propagates_type_errors_from_custom_exporters():
+    class TestObject:
+        def to_json(self):
+            raise TypeError("Not today")
+
+    with pytest.raises(TypeError, match="Not today"):
+        dumps({"a": [TestObject()]}, cls=FilamentEncoder)
+
+
+def test_encoder_converts_collections_lazily():
+    with patch("filament._export.to_json") as MockClass:
+        MockClass.side_effect = str
+        assert (
+            dumps({"a": frozenset([Decimal(1)])}, cls=FilamentEncoder) == '{"a": ["1"]}'
+        )
+        assert MockClass.call_count == 1
+
+
+def test_dumps_supports_custom_json_exporter_protocol():
+    class TestObject:
+        def __init__(self, value):
+            self.value = value
+
+        def to_json(self):
+            return self.value + "!"
+
+    assert dumps({"a": [TestObject("Hello")]}) == '{"a": ["Hello!"]}'
+    assert dumps({"a": [TestObject("Hello")]}, cls=FilamentEncoder) == (
+        '{"a": ["Hello!"]}'
+    )
+
+
+def test_dumps_supports_custom_json_exporter_protocol_on_native_subclasses():
+    class TestInt(int):
+        def to_json(self):
+            return "TestInt"
+
+    @dataclass
+    class TestObject:
+        x: int
+
+    assert dumps(TestInt(3)) == '"TestInt"'
+    assert dumps({"x": TestInt(1)}) == '{"x": "TestInt"}'
+    assert dumps([TestObject(TestInt(1))]) == '[{"x": "TestInt"}]'
+
+    assert dumps(TestInt(3), cls=FilamentEncoder) == '"TestInt"'
+    assert dumps([TestObject(TestInt(1))], cls=FilamentEncoder) == '[{"x": "TestInt"}]'
+    assert dumps({1: {TestInt(1)}}, cls=FilamentEncoder) == '{"1": ["TestInt"]}'
+
+
+def test_dumps_raises_error_when_exporting_an_unsupported_type():
+    class TestObject:
+        pass
+
+    with pytest.raises(ExportTypeError):
+        dumps([TestObject()])
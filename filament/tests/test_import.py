@@ -1,14 +1,13 @@
-from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
-from enum import Enum
-from typing import Annotated, Any, Optional, Type, Union
-from unittest.mock import patch
+from enum import Enum, Flag
+from typing import Annotated, List, Optional, Union
 
 import pytest
 
 from filament import (
+    Choices,
     ImportTypeError,
     NoneRequiredError,
     TaggedClass,
@@ -18,21 +17,6 @@ from filament import (
 )
 
 
-@dataclass(frozen=True)
-class FromJsonCall:
-    value: Any
-    target_spec: Type
-
-
-@contextmanager
-def mock_from_json():
-    with patch("filament._import.from_json") as MockClass:
-        MockClass.side_effect = lambda value, target_spec, **kwargs: FromJsonCall(
-            value, target_spec
-        )
-        yield None
-
-
 def test_imports_none_as_none():
     assert from_json(None, type(None)) is None
 
@@ -83,78 +67,113 @@ def test_imports_str_as_str():
 
 
 def test_recursively_imports_lists():
-    with mock_from_json():
-        assert from_json([1, 2, 3], list[int]) == [
-            FromJsonCall(1, int),
-            FromJsonCall(2, int),
-            FromJsonCall(3, int),
-        ]
+    assert from_json(["1.5", None, "3"], list[Optional[Decimal]]) == [
+        Decimal("1.5"),
+        None,
+        Decimal("3"),
+    ]
 
 
 def test_recursively_imports_list_subclass():
     class TestList(list):
         pass
 
-    with mock_from_json():
-        obj = from_json([1, 2, 3], TestList[int])
-        assert isinstance(obj, TestList)
-        assert obj == TestList(
-            [
-                FromJsonCall(1, int),
-                FromJsonCall(2, int),
-                FromJsonCall(3, int),
-            ]
-        )
+    obj = from_json(["1.5", None, "3"], TestList[Optional[Decimal]])
+    assert isinstance(obj, TestList)
+    assert obj == TestList([Decimal("1.5"), None, Decimal("3")])
 
 
 def test_recursively_imports_sets():
-    with mock_from_json():
-        assert from_json([1, 2, 3], set[int]) == {
-            FromJsonCall(1, int),
-            FromJsonCall(2, int),
-            FromJsonCall(3, int),
-        }
+    assert from_json(["1.5", None, "3"], set[Optional[Decimal]]) == {
+        Decimal("1.5"),
+        None,
+        Decimal("3"),
+    }
 
 
 def test_recursively_imports_set_subclass():
     class TestSet(set):
         pass
 
-    with mock_from_json():
-        obj = from_json([1, 2, 3], TestSet[int])
-        assert isinstance(obj, TestSet)
-        assert obj == TestSet(
-            [
-                FromJsonCall(1, int),
-                FromJsonCall(2, int),
-                FromJsonCall(3, int),
-            ]
-        )
+    obj = from_json(["1.5", None, "3"], TestSet[Optional[Decimal]])
+    assert isinstance(obj, TestSet)
+    assert obj == TestSet([Decimal("1.5"), None, Decimal("3")])
+
+
+def test_imports_collections_of_simple_types():
+    class TestList(list):
+        pass
+
+    assert from_json(["1", 2, 3], list[int]) == [1, 2, 3]
+    assert from_json(["2021-01-02"], set[date]) == {date(2021, 1, 2)}
+
+    obj = from_json([1, 2], TestList[float])
+    assert isinstance(obj, TestList)
+    assert obj == [1.0, 2.0]
+
+    with pytest.raises(ValueRequiredError):
+        from_json([1, None], list[int])
+
+    with pytest.raises(ValueError):
+        from_json([1, "foo"], list[int])
+
+
+def test_rejects_none_items_in_collections_of_simple_types():
+    class TestEnum(Enum):
+        A = None
+
+    for spec in (list[str], list[bool], set[str], tuple[str, ...], list[TestEnum]):
+        with pytest.raises(ValueRequiredError):
+            from_json([None], spec)
+
+
+def test_recursively_imports_collections_of_collections():
+    assert from_json([[1], ["2"]], list[list[str]]) == [["1"], ["2"]]
+    assert from_json([["2021-01-02"]], list[set[date]]) == [{date(2021, 1, 2)}]
 
 
 def test_recursively_imports_dicts():
-    with mock_from_json():
-        assert from_json({"a": 1, "b": 2, "c": 3}, dict[str, int]) == {
-            FromJsonCall("a", str): FromJsonCall(1, int),
-            FromJsonCall("b", str): FromJsonCall(2, int),
-            FromJsonCall("c", str): FromJsonCall(3, int),
-        }
+    assert from_json({"a": 1, "b": "2", "c": None}, dict[str, Optional[int]]) == {
+        "a": 1,
+        "b": 2,
+        "c": None,
+    }
 
 
 def test_recursively_imports_dict_subclass():
     class TestDict(dict):
         pass
 
-    with mock_from_json():
-        obj = from_json({"a": 1, "b": 2, "c": 3}, TestDict[str, int])
-        assert isinstance(obj, TestDict)
-        assert obj == TestDict(
-            {
-                FromJsonCall("a", str): FromJsonCall(1, int),
-                FromJsonCall("b", str): FromJsonCall(2, int),
-                FromJsonCall("c", str): FromJsonCall(3, int),
-            }
-        )
+    obj = from_json({"a": 1, "b": "2", "c": None}, TestDict[str, Optional[int]])
+    assert isinstance(obj, TestDict)
+    assert obj == TestDict({"a": 1, "b": 2, "c": None})
+
+
+def test_imports_mappings_of_simple_types():
+    assert from_json({"2021-01-02": "1.5"}, dict[date, Decimal]) == {
+        date(2021, 1, 2): Decimal("1.5")
+    }
+
+    with pytest.raises(ValueRequiredError):
+        from_json({"a": None}, dict[str, int])
+
+
+def test_recursively_imports_tuples():
+    assert from_json(["1.5", 2], tuple[Decimal, str]) == (Decimal("1.5"), "2")
+    assert from_json(["1.5", "2"], tuple[Decimal, ...]) == (
+        Decimal("1.5"),
+        Decimal("2"),
+    )
+
+
+def test_rejects_none_values_in_mappings_of_simple_types():
+    for spec in (dict[str, str], dict[str, bool]):
+        with pytest.raises(ValueRequiredError):
+            from_json({"a": None}, spec)
+
+
+def test_recursively_imports_mappings_of_collections():
+    assert from_json({"a": [1, "2"]}, dict[str, list[int]]) == {"a": [1, 2]}
 
 
 def test_imports_decimal_from_str():
@@ -174,6 +193,33 @@ def test_imports_enum():
     assert from_json(3, TestEnum) is TestEnum.C
 
 
+def test_imports_enum_values_missing_from_its_members():
+    class TestEnum(Enum):
+        A = "a"
+        B = "b"
+
+        @classmethod
+        def _missing_(cls, value):
+            for member in cls:
+                if isinstance(value, str) and member.value == value.lower():
+                    return member
+            return None
+
+    class TestFlag(Flag):
+        X = 1
+        Y = 2
+
+    assert from_json("A", TestEnum) is TestEnum.A
+    assert from_json(["B", "a"], list[TestEnum]) == [TestEnum.B, TestEnum.A]
+    assert from_json(3, TestFlag) == TestFlag.X | TestFlag.Y
+
+    with pytest.raises(ValueError):
+        from_json("c", TestEnum)
+
+    with pytest.raises(ValueError):
+        from_json([1, 4], list[TestFlag])
+
+
 def test_imports_date_from_iso_str():
     d = date.today()
     assert from_json(d.isoformat(), date) == d
@@ -203,6 +249,19 @@ def test_supports_custom_json_importer_protocol():
     assert obj.value == "Hello!"
 
 
+def test_custom_json_importer_can_call_default_implementation():
+    @dataclass
+    class TestObject:
+        x: int
+
+        @classmethod
+        def from_json(cls, value):
+            return from_json({"x": value}, cls, use_custom_importer=False)
+
+    assert from_json(1, TestObject) == TestObject(x=1)
+    assert from_json([1], list[TestObject]) == [TestObject(x=1)]
+
+
 def test_can_override_import_protocol_on_int_subclasses():
     class TestInt(int):
         @classmethod
@@ -240,32 +299,38 @@ def test_imports_object_with_type_hints_from_dict():
     class TestObject:
         num: int
         text: str
+        items: list[Decimal]
 
-        def __init__(self, num, text):
+        def __init__(self, num, text, items):
             self.num = num
             self.text = text
+            self.items = items
 
-    with mock_from_json():
-        obj = from_json({"num": 1, "text": "foobar"}, TestObject)
-        assert isinstance(obj, TestObject)
-        assert obj.num == FromJsonCall(1, int)
-        assert obj.text == FromJsonCall("foobar", str)
+    obj = from_json({"num": 1, "text": "foobar", "items": ["1.5"]}, TestObject)
+    assert isinstance(obj, TestObject)
+    assert obj.num == 1
+    assert obj.text == "foobar"
+    assert obj.items == [Decimal("1.5")]
 
 
 def test_imports_object_with_annotated_type_hints_from_dict():
+    constraint = Choices([2])
+
     class TestObject:
         num: Annotated[int, "foobar"]
         text: str
+        even: Annotated[int, constraint]
 
-        def __init__(self, num, text):
+        def __init__(self, num, text, even):
             self.num = num
             self.text = text
+            self.even = even
 
-    with mock_from_json():
-        obj = from_json({"num": 1, "text": "foobar"}, TestObject)
-        assert isinstance(obj, TestObject)
-        assert obj.num == FromJsonCall(1, Annotated[int, "foobar"])
-        assert obj.text == FromJsonCall("foobar", str)
+    obj = from_json({"num": 1, "text": "foobar", "even": 2}, TestObject)
+    assert isinstance(obj, TestObject)
+    assert obj.num == 1
+    assert obj.text == "foobar"
+    assert obj.even == 2
 
 
 def test_imports_dataclass_instance_from_dict():
@@ -273,12 +338,13 @@ def test_imports_dataclass_instance_from_dict():
     class TestObject:
         num: int
         text: str
+        items: list[Decimal]
 
-    with mock_from_json():
-        obj = from_json({"num": 1, "text": "foobar"}, TestObject)
-        assert isinstance(obj, TestObject)
-        assert obj.num == FromJsonCall(1, int)
-        assert obj.text == FromJsonCall("foobar", str)
+    obj = from_json({"num": 1, "text": "foobar", "items": ["1.5"]}, TestObject)
+    assert isinstance(obj, TestObject)
+    assert obj.num == 1
+    assert obj.text == "foobar"
+    assert obj.items == [Decimal("1.5")]
 
 
 def test_imports_frozen_dataclass_instance_from_dict():
@@ -286,12 +352,65 @@ def test_imports_frozen_dataclass_instance_from_dict():
     class TestObject:
         num: int
         text: str
+        items: list[Decimal]
+
+    obj = from_json({"num": 1, "text": "foobar", "items": ["1.5"]}, TestObject)
+    assert isinstance(obj, TestObject)
+    assert obj.num == 1
+    assert obj.text == "foobar"
+    assert obj.items == [Decimal("1.5")]
+
+
+def test_imports_simple_fields_like_from_json():
+    class TestEnum(Enum):
+        A = 1
 
-    with mock_from_json():
-        obj = from_json({"num": 1, "text": "foobar"}, TestObject)
-        assert isinstance(obj, TestObject)
-        assert obj.num == FromJsonCall(1, int)
-        assert obj.text == FromJsonCall("foobar", str)
+    @dataclass
+    class TestObject:
+        num: int
+        flag: bool
+        price: Decimal
+        kind: TestEnum
+        day: date
+        maybe: Optional[float]
+
+    data = {
+        "num": "3",
+        "flag": True,
+        "price": "1.50",
+        "kind": 1,
+        "day": "2021-01-02",
+        "maybe": None,
+    }
+    assert from_json(data, TestObject) == TestObject(
+        num=3,
+        flag=True,
+        price=Decimal("1.50"),
+        kind=TestEnum.A,
+        day=date(2021, 1, 2),
+        maybe=None,
+    )
+    assert from_json({**data, "maybe": 2}, TestObject).maybe == 2.0
+
+    with pytest.raises(ValueRequiredError):
+        from_json({**data, "num": None}, TestObject)
+
+    with pytest.raises(ValueRequiredError):
+        from_json({**data, "day": None}, TestObject)
+
+    with pytest.raises(ImportTypeError):
+        from_json({**data, "maybe": "foo"}, TestObject)
+
+
+@dataclass
+class Node:
+    value: int
+    children: List["Node"]
+
+
+def test_imports_recursive_types():
+    data = {"value": 1, "children": [{"value": 2, "children": []}]}
+    assert from_json(data, Node) == Node(1, [Node(2, [])])
 
 
 def test_raises_error_when_importing_an_unsupported_type():
@@ -312,6 +431,46 @@ def test_can_import_unions():
     assert from_json("foobar", Union[int, str]) == "foobar"
 
 
+def test_can_import_unions_of_containers():
+    assert from_json([1, 2], Union[int, list[int]]) == [1, 2]
+    assert from_json({"a": 1}, Union[list[int], dict[str, int]]) == {"a": 1}
+    assert from_json("2021-01-01", Union[int, date]) == date(2021, 1, 1)
+    assert from_json(None, Union[datetime, int, None]) is None
+
+
+def test_can_import_unions_of_objects():
+    @dataclass
+    class A:
+        a: int
+
+    @dataclass
+    class B:
+        b: int
+
+        @classmethod
+        def from_json(cls, value):
+            return cls(b=int(value))
+
+    assert from_json("x", Union[A, str]) == "x"
+    assert from_json({"a": 1}, Union[A, str]) == A(a=1)
+    assert from_json("5", Union[A, B]) == B(b=5)
+    assert from_json({"a": 1}, Union[list[A], A]) == A(a=1)
+    assert from_json([{"a": 1}], Union[A, list[A]]) == [A(a=1)]
+
+    with pytest.raises(ImportTypeError):
+        from_json(5, Union[A, list[A]])
+
+
+def test_respects_member_order_of_nested_unions():
+    assert from_json(["5"], list[Union[int, str]]) == [5]
+    assert from_json(["5"], list[Union[str, int]]) == ["5"]
+
+
+def test_raises_error_when_importing_none_on_union_without_none():
+    with pytest.raises(ImportTypeError):
+        from_json(None, Union[int, str])
+
+
 def test_raises_error_when_no_union_type_matches():
     with pytest.raises(ImportTypeError):
         assert from_json("foobar", Union[int, datetime])
@@ -351,6 +510,20 @@ def test_can_discriminate_tagged_classes():
     )
 
 
+def test_discriminates_tagged_classes_declared_after_importing_their_base():
+    @dataclass
+    class A(TaggedClass):
+        a: str
+
+    assert from_json({"class": "A", "a": "a"}, A) == A(a="a")
+
+    @dataclass
+    class B(A):
+        b: str
+
+    assert from_json({"class": "B", "a": "a", "b": "b"}, A) == B(a="a", b="b")
+
+
 def test_assumes_root_class_when_importing_tagged_classes_with_tag_missing():
     @dataclass
     class A(TaggedClass):